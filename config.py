@@ -43,10 +43,27 @@ MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
 RETRY_DELAY: float = float(os.getenv("RETRY_DELAY", "1.0"))
 BACKOFF_MULTIPLIER: float = float(os.getenv("BACKOFF_MULTIPLIER", "2.0"))
 
+# Maximum number of agent queries in flight at once in concurrent demos;
+# keep within your provider's requests-per-minute budget
+MAX_CONCURRENT_QUERIES: int = int(os.getenv("MAX_CONCURRENT_QUERIES", "4"))
+
 # Timeout configuration (in seconds)
 DEFAULT_TIMEOUT: int = int(os.getenv("DEFAULT_TIMEOUT", "30"))
 LONG_TIMEOUT: int = int(os.getenv("LONG_TIMEOUT", "120"))
 
+# =============================================================================
+# Caching Configuration
+# =============================================================================
+
+# Exact-match prompt cache for ADKSessionManager.run_query (opt-in: the key
+# ignores session history, and cached tool results may be stale)
+PROMPT_CACHE_ENABLED: bool = os.getenv("PROMPT_CACHE_ENABLED", "false").lower() == "true"
+
+# Semantic prompt cache (requires sentence-transformers and faiss-cpu)
+SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_MODEL: str = os.getenv("SEMANTIC_CACHE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+
 # =============================================================================
 # Logging Configuration
 # =============================================================================
@@ -219,6 +236,8 @@ def print_config_summary() -> None:
     print(f"Test Mode: {TEST_MODE}")
     print(f"Max Retries: {MAX_RETRIES}")
     print(f"Timeout: {DEFAULT_TIMEOUT}s")
+    print(f"Prompt Cache: {PROMPT_CACHE_ENABLED}")
+    print(f"Semantic Cache: {SEMANTIC_CACHE_ENABLED}")
     
     # API Keys status
     api_keys = get_api_keys()
@@ -283,8 +302,15 @@ __all__ = [
     "MAX_RETRIES",
     "RETRY_DELAY",
     "BACKOFF_MULTIPLIER",
+    "MAX_CONCURRENT_QUERIES",
     "DEFAULT_TIMEOUT",
     
+    # Caching Configuration
+    "PROMPT_CACHE_ENABLED",
+    "SEMANTIC_CACHE_ENABLED",
+    "SEMANTIC_CACHE_MODEL",
+    "SEMANTIC_CACHE_THRESHOLD",
+    
     # Helper Functions
     "get_session_config",
     "get_model_config",
@@ -12,13 +12,18 @@ import os
 # Add project root to path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from weather_assistant import create_weather_agent, demo_weather_assistant
+# weather_assistant (and the ADK stack behind it) is imported inside the
+# functions below, so exiting at the menu does not pay for loading it
 from utils.session_helpers import ADKSessionManager, validate_config
+from utils.input_helpers import enable_input_history
 from config import print_config_summary
 
-def interactive_mode():
+def interactive_mode(agent=None):
     """
     Run the weather assistant in interactive mode.
+    
+    Args:
+        agent: Optional existing agent to reuse (one is created if not provided)
     """
     print("\n🤖 Interactive Weather Assistant")
     print("=" * 40)
@@ -29,9 +34,12 @@ def interactive_mode():
     print("- Type 'quit' or 'exit' to stop")
     print("-" * 40)
     
+    from weather_assistant import create_weather_agent
+    
     # Create the agent and session
     try:
-        agent = create_weather_agent()
+        if agent is None:
+            agent = create_weather_agent()
         session_manager = ADKSessionManager(app_name="interactive_weather")
         session_manager.create_runner(agent)
     except Exception as e:
@@ -60,17 +68,25 @@ def interactive_mode():
         except Exception as e:
             print(f"❌ Error: {e}")
 
-def run_examples():
+def run_examples(agent=None):
     """
     Run predefined examples.
+    
+    Args:
+        agent: Optional existing agent to reuse (one is created if not provided)
     """
+    from weather_assistant import demo_weather_assistant
+    
     print("🚀 Running predefined examples...")
-    demo_weather_assistant()
+    demo_weather_assistant(agent)
 
 def main():
     """
     Main function to run the weather assistant example.
     """
+    # Line editing and history for the prompts below
+    enable_input_history(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".hist"))
+    
     print("🌤️  Weather Assistant - ADK Sample")
     print("=" * 50)
     
@@ -92,16 +108,20 @@ def main():
     try:
         choice = input("\nEnter your choice (1-3): ").strip()
         
+        # Build the agent once and share it between the demos
+        from weather_assistant import create_weather_agent
+        agent = create_weather_agent()
+        
         if choice == "1":
-            run_examples()
+            run_examples(agent)
         elif choice == "2":
-            interactive_mode()
+            interactive_mode(agent)
         elif choice == "3":
-            run_examples()
-            interactive_mode()
+            run_examples(agent)
+            interactive_mode(agent)
         else:
             print("Invalid choice. Running examples by default.")
-            run_examples()
+            run_examples(agent)
             
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
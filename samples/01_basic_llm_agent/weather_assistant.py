@@ -11,20 +11,16 @@ The agent uses the Gemini model to decide which tool to call based on user input
 
 import sys
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
 # Add project root to path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, validate_required_config
+from config import DEFAULT_MODEL, validate_required_config
 from utils.session_helpers import validate_config
 
-import google.generativeai as genai
-from google.adk.agents import LlmAgent
-
-# Configure Google AI
-if GOOGLE_API_KEY:
-    genai.configure(api_key=GOOGLE_API_KEY)
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
 
 def get_weather(city: str) -> Dict[str, Any]:
     """
@@ -120,7 +116,7 @@ def get_time_info(timezone: str = "UTC") -> Dict[str, Any]:
             "description": f"Error getting time for {timezone}: {str(e)}"
         }
 
-def create_weather_agent() -> LlmAgent:
+def create_weather_agent() -> "LlmAgent":
     """
     Creates and configures the weather assistant agent.
     
@@ -131,6 +127,9 @@ def create_weather_agent() -> LlmAgent:
     if not validate_config():
         raise ValueError("Invalid configuration. Please check your API key.")
     
+    # Import the ADK stack only when an agent is actually built
+    from google.adk.agents import LlmAgent
+    
     # Create the agent with tools
     agent = LlmAgent(
         name="weather_assistant",
@@ -152,22 +151,26 @@ def create_weather_agent() -> LlmAgent:
     
     return agent
 
-def demo_weather_assistant():
+def demo_weather_assistant(agent: Optional["LlmAgent"] = None):
     """
     Demonstrates the weather assistant with example queries.
+    
+    Args:
+        agent: Optional existing agent to reuse (one is created if not provided)
     """
     from utils.session_helpers import ADKSessionManager, print_session_info
     
     print("🌤️  Weather Assistant Demo")
     print("=" * 50)
     
-    # Create the agent
-    try:
-        agent = create_weather_agent()
-        print("✅ Weather assistant created successfully!")
-    except Exception as e:
-        print(f"❌ Error creating agent: {e}")
-        return
+    # Create the agent unless the caller already has one
+    if agent is None:
+        try:
+            agent = create_weather_agent()
+            print("✅ Weather assistant created successfully!")
+        except Exception as e:
+            print(f"❌ Error creating agent: {e}")
+            return
     
     # Create session manager
     session_manager = ADKSessionManager(app_name="weather_assistant_demo")
@@ -12,67 +12,107 @@ Each agent in the sequence receives output from the previous agent as input.
 
 import sys
 import os
-from typing import Dict, Any, List
-from datetime import datetime
+import re
+import json
+import string
+import time
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
 
 # Add project root to path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, validate_required_config
+from config import DEFAULT_MODEL, MAX_CONCURRENT_QUERIES, validate_required_config
 from utils.session_helpers import validate_config
 
-import google.generativeai as genai
-from google.adk.agents import LlmAgent, SequentialAgent
+if TYPE_CHECKING:
+    from google.adk.agents import SequentialAgent
+    from utils.session_helpers import ADKSessionManager
 
-# Configure Google AI
-if GOOGLE_API_KEY:
-    genai.configure(api_key=GOOGLE_API_KEY)
+# Patterns and keyword sets used by extract_data, built once at import time
+_NUM_RE = re.compile(r'\d+(?:\.\d+)?')
+_PUNCT_TABLE = str.maketrans('', '', '.,!?')
+_TYPE_PUNCT_TABLE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+_BUSINESS = frozenset({"sales", "revenue", "profit", "business"})
+_CUSTOMER = frozenset({"customer", "feedback", "review", "satisfaction"})
+_PRODUCT = frozenset({"product", "launch", "feature", "development"})
+
+# Content types in priority order, and a keyword -> priority lookup table
+_CONTENT_TYPES = ("business", "customer_feedback", "product")
+_TYPE_MAP = {
+    keyword: priority
+    for priority, keywords in enumerate((_BUSINESS, _CUSTOMER, _PRODUCT))
+    for keyword in keywords
+}
 
 def extract_data(input_text: str) -> Dict[str, Any]:
     """
     Extracts structured data from raw input text.
     
+    The content type is chosen from whole-word keyword matches, ignoring case
+    and punctuation and accepting a plural "s" (so "Review:" and "products"
+    match, but "wholesales" does not). When several types match, business
+    wins over customer_feedback, which wins over product.
+    
+    Entities and keywords are read after removing '.,!?', so a word such as
+    "year." is 4 characters long and is not a keyword.
+    
     Args:
         input_text: The raw text to extract data from
         
     Returns:
         Dictionary with extracted data including entities, keywords, and metadata
     """
-    import re
-    
     # Simple extraction logic - in production, use NLP libraries
-    words = input_text.split()
-    word_count = len(words)
+    word_count = len(input_text.split())
     char_count = len(input_text)
     
-    # Extract potential entities (capitalized words)
-    entities = [word.strip('.,!?') for word in words if word[0].isupper() and len(word) > 1]
+    # Strip punctuation once for the whole text instead of once per word
+    tokens = input_text.translate(_PUNCT_TABLE).split()
+    
+    # Single pass over the tokens:
+    # - potential entities are capitalized words
+    # - keywords are words longer than 4 characters
+    # Only the top 5 entities and top 10 keywords are kept, so stop scanning
+    # once both are full
+    entities = []
+    keywords = []
+    for token in tokens:
+        if token[0].isupper() and len(token) > 1:
+            entities.append(token)
+        if len(token) > 4:
+            keywords.append(token.lower())
+        if len(entities) >= 5 and len(keywords) >= 10:
+            break
+    entities = entities[:5]
+    keywords = keywords[:10]
     
     # Extract numbers
-    numbers = re.findall(r'\d+(?:\.\d+)?', input_text)
-    
-    # Extract keywords (words longer than 4 characters)
-    keywords = [word.lower().strip('.,!?') for word in words if len(word) > 4]
-    
-    # Determine content type
-    content_type = "general"
-    if any(word.lower() in input_text.lower() for word in ["sales", "revenue", "profit", "business"]):
-        content_type = "business"
-    elif any(word.lower() in input_text.lower() for word in ["customer", "feedback", "review", "satisfaction"]):
-        content_type = "customer_feedback"
-    elif any(word.lower() in input_text.lower() for word in ["product", "launch", "feature", "development"]):
-        content_type = "product"
+    numbers = _NUM_RE.findall(input_text)
+    
+    # Determine content type with one dictionary probe per lowercased word,
+    # keeping the highest-priority match and stopping early on "business"
+    best_priority = len(_CONTENT_TYPES)
+    for token in input_text.lower().translate(_TYPE_PUNCT_TABLE).split():
+        priority = _TYPE_MAP.get(token)
+        if priority is None:
+            priority = _TYPE_MAP.get(token[:-1], best_priority) if token.endswith("s") else best_priority
+        if priority < best_priority:
+            best_priority = priority
+            if priority == 0:
+                break
+    content_type = _CONTENT_TYPES[best_priority] if best_priority < len(_CONTENT_TYPES) else "general"
     
     return {
         "status": "success",
         "original_text": input_text,
         "word_count": word_count,
         "character_count": char_count,
-        "entities": entities[:5],  # Limit to top 5
+        "entities": entities,  # Top 5
         "numbers": numbers,
-        "keywords": keywords[:10],  # Limit to top 10
+        "keywords": keywords,  # Top 10
         "content_type": content_type,
-        "extraction_timestamp": datetime.now().isoformat(),
+        "extraction_timestamp": time.time(),  # seconds since the epoch
         "extracted_data": {
             "text": input_text,
             "length": char_count,
@@ -81,6 +121,28 @@ def extract_data(input_text: str) -> Dict[str, Any]:
         }
     }
 
+def _check_rules(length: int, num_key_elements: int, is_generic: bool,
+                 word_count: int) -> Tuple[bool, bool, bool, bool]:
+    """
+    Evaluates the four validation rules, each worth 25 quality points.
+    
+    Args:
+        length: Character length of the text
+        num_key_elements: Number of extracted key elements
+        is_generic: Whether the content type is "general"
+        word_count: Number of words in the text
+        
+    Returns:
+        Pass/fail for: minimum length, meaningful content,
+        content type identified, reasonable word count
+    """
+    return (
+        length >= 10,
+        num_key_elements > 0,
+        not is_generic,
+        5 <= word_count <= 1000
+    )
+
 def validate_data(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validates the extracted data against quality rules.
@@ -96,7 +158,7 @@ def validate_data(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
         "is_valid": True,
         "validation_errors": [],
         "quality_score": 0,
-        "validation_timestamp": datetime.now().isoformat()
+        "validation_timestamp": time.time()  # seconds since the epoch
     }
     
     # Extract the data to validate
@@ -108,33 +170,25 @@ def validate_data(extracted_data: Dict[str, Any]) -> Dict[str, Any]:
     
     data = extracted_data["extracted_data"]
     
-    # Validation rules
-    quality_score = 0
-    
-    # Rule 1: Minimum length
-    if data.get("length", 0) >= 10:
-        quality_score += 25
-    else:
-        validation_results["validation_errors"].append("Text too short (minimum 10 characters)")
-    
-    # Rule 2: Has meaningful content
-    if data.get("key_elements") and len(data["key_elements"]) > 0:
-        quality_score += 25
-    else:
-        validation_results["validation_errors"].append("No key elements identified")
-    
-    # Rule 3: Content type identified
-    if data.get("type") != "general":
-        quality_score += 25
-    else:
-        validation_results["validation_errors"].append("Generic content type")
-    
-    # Rule 4: Reasonable word count
+    # Validation rules, scored from plain values extracted once
     word_count = extracted_data.get("word_count", 0)
-    if 5 <= word_count <= 1000:
-        quality_score += 25
-    else:
-        validation_results["validation_errors"].append(f"Word count out of range: {word_count}")
+    rules = _check_rules(
+        data.get("length", 0),
+        len(data.get("key_elements") or []),
+        data.get("type") == "general",
+        word_count
+    )
+    quality_score = 25 * sum(rules)
+    
+    rule_errors = (
+        "Text too short (minimum 10 characters)",
+        "No key elements identified",
+        "Generic content type",
+        f"Word count out of range: {word_count}"
+    )
+    validation_results["validation_errors"].extend(
+        error for passed, error in zip(rules, rule_errors) if not passed
+    )
     
     validation_results["quality_score"] = quality_score
     validation_results["is_valid"] = quality_score >= 50  # Minimum 50% quality
@@ -181,7 +235,7 @@ def format_data(validation_result: Dict[str, Any]) -> Dict[str, Any]:
                 "grade": "A" if quality_score >= 75 else "B" if quality_score >= 50 else "C"
             },
             "metadata": {
-                "processed_at": datetime.now().isoformat(),
+                "processed_at": time.time(),  # seconds since the epoch
                 "pipeline_version": "1.0",
                 "processing_steps": ["extraction", "validation", "formatting"]
             }
@@ -199,7 +253,7 @@ def format_data(validation_result: Dict[str, Any]) -> Dict[str, Any]:
     
     return formatted_output
 
-def create_data_pipeline() -> SequentialAgent:
+def create_data_pipeline() -> "SequentialAgent":
     """
     Creates and configures the data processing pipeline.
     
@@ -210,6 +264,9 @@ def create_data_pipeline() -> SequentialAgent:
     if not validate_config():
         raise ValueError("Invalid configuration. Please check your API key.")
     
+    # Import the ADK stack only when a pipeline is actually built
+    from google.adk.agents import LlmAgent, SequentialAgent
+    
     # Create individual agents for each step
     extractor_agent = LlmAgent(
         name="data_extractor",
@@ -218,6 +275,7 @@ def create_data_pipeline() -> SequentialAgent:
         output_key="extraction_result",
         instruction="""You are a data extraction agent. 
         When given user input, call extract_data(input_text) with the provided text.
+        If the input contains several numbered items, call extract_data once per item.
         Return only the extraction result.""",
         description="Extracts structured data from raw text input"
     )
@@ -229,6 +287,7 @@ def create_data_pipeline() -> SequentialAgent:
         output_key="validation_result",
         instruction="""You are a data validation agent.
         Take the extraction result from the previous step and call validate_data(extracted_data).
+        If there are several extraction results, call validate_data once per result, keeping their order.
         Return only the validation result.""",
         description="Validates extracted data against quality rules"
     )
@@ -240,6 +299,8 @@ def create_data_pipeline() -> SequentialAgent:
         output_key="final_result",
         instruction="""You are a data formatting agent.
         Take the validation result from the previous step and call format_data(validation_result).
+        If there are several validation results, call format_data once per result, keeping their order,
+        and follow any output format requested by the user.
         Return only the formatted final result.""",
         description="Formats validated data for final output"
     )
@@ -253,29 +314,82 @@ def create_data_pipeline() -> SequentialAgent:
     
     return pipeline
 
-def demo_data_pipeline():
-    """
-    Demonstrates the data processing pipeline with example data.
+def run_pipeline_local(text: str) -> Dict[str, Any]:
     """
-    from utils.session_helpers import ADKSessionManager, print_session_info
+    Runs the extraction, validation and formatting steps directly.
     
-    print("📊 Data Processing Pipeline Demo")
-    print("=" * 50)
+    The three steps are deterministic Python functions, so for demos and
+    tests they can be chained locally instead of asking an LLM agent to call
+    each one, which costs three model round-trips per input.
     
-    # Create the pipeline
+    Args:
+        text: The raw text to process
+        
+    Returns:
+        The formatted final output, as produced by format_data
+    """
+    return format_data(validate_data(extract_data(text)))
+
+def _print_demo_result(i: int, data: str, response: Any) -> None:
+    """Print one demo input with its result or error."""
+    print(f"\n{i}. Input: {data}")
+    if isinstance(response, Exception):
+        print(f"   Error: {response}")
+    else:
+        print(f"   Result: {response[:200]}...")  # Truncate for readability
+
+def _demo_local(example_data: List[str]) -> None:
+    """Run the demo inputs through the pipeline steps locally."""
+    print("Processing example data locally (use --llm to run through the agents):")
+    print("-" * 50)
+    
+    for i, data in enumerate(example_data, 1):
+        try:
+            _print_demo_result(i, data, json.dumps(run_pipeline_local(data)))
+        except Exception as e:
+            _print_demo_result(i, data, e)
+
+async def _demo_batch(session_manager: "ADKSessionManager", example_data: List[str]) -> None:
+    """Send all demo inputs to the agent pipeline in one batched prompt."""
+    queries = [f"Process this data: {data}" for data in example_data]
     try:
-        pipeline = create_data_pipeline()
-        print("✅ Data processing pipeline created successfully!")
+        results = await session_manager.run_batch_async(queries)
     except Exception as e:
-        print(f"❌ Error creating pipeline: {e}")
-        return
+        results = [e] * len(example_data)
     
-    # Create session manager
-    session_manager = ADKSessionManager(app_name="data_pipeline_demo")
-    runner = session_manager.create_runner(pipeline)
+    for i, (data, response) in enumerate(zip(example_data, results), 1):
+        _print_demo_result(i, data, response)
+
+async def _demo_concurrent(session_manager: "ADKSessionManager", example_data: List[str]) -> None:
+    """Send the demo inputs to the agent pipeline concurrently."""
+    queries = [f"Process this data: {data}" for data in example_data]
+    
+    # Print each result as soon as it lands instead of waiting for the slowest
+    async for index, response, _ in session_manager.iter_queries_as_completed(
+        queries, max_concurrency=MAX_CONCURRENT_QUERIES
+    ):
+        _print_demo_result(index + 1, example_data[index], response)
+
+async def demo_data_pipeline(pipeline: Optional["SequentialAgent"] = None, batch: bool = False,
+                             use_llm: bool = False):
+    """
+    Demonstrates the data processing pipeline with example data.
     
-    # Print session info
-    print_session_info(session_manager)
+    By default the pipeline steps run locally with run_pipeline_local. With
+    use_llm, all example inputs are sent to the agent pipeline concurrently,
+    each in its own session, and results are printed in completion order as
+    soon as each one is ready.
+    
+    Args:
+        pipeline: Optional existing pipeline to reuse (one is created if not provided)
+        batch: With use_llm, send all inputs in a single batched prompt instead,
+            paying the prompt and network overhead once for the whole set
+        use_llm: Route the inputs through the LLM agent pipeline
+    """
+    from utils.session_helpers import ADKSessionManager, print_session_info
+    
+    print("📊 Data Processing Pipeline Demo")
+    print("=" * 50)
     
     # Example data to process
     example_data = [
@@ -286,21 +400,44 @@ def demo_data_pipeline():
         "Our business strategy focuses on customer-centric product development and innovation."
     ]
     
-    print("Processing example data through the pipeline:")
-    print("-" * 50)
-    
-    for i, data in enumerate(example_data, 1):
-        print(f"\n{i}. Input: {data}")
-        print("   Processing through pipeline...")
+    if not use_llm:
+        _demo_local(example_data)
+    else:
+        # Create the pipeline unless the caller already has one
+        if pipeline is None:
+            try:
+                pipeline = create_data_pipeline()
+                print("✅ Data processing pipeline created successfully!")
+            except Exception as e:
+                print(f"❌ Error creating pipeline: {e}")
+                return
         
-        try:
-            response = session_manager.run_query(f"Process this data: {data}")
-            print(f"   Result: {response[:200]}...")  # Truncate for readability
-        except Exception as e:
-            print(f"   Error: {e}")
+        # Create session manager
+        session_manager = ADKSessionManager(app_name="data_pipeline_demo")
+        runner = session_manager.create_runner(pipeline)
+        
+        # Print session info
+        print_session_info(session_manager)
+        
+        print("Processing example data through the pipeline:")
+        print("-" * 50)
+        
+        if batch:
+            await _demo_batch(session_manager, example_data)
+        else:
+            await _demo_concurrent(session_manager, example_data)
     
     print("\n" + "=" * 50)
     print("Pipeline demo completed!")
 
 if __name__ == "__main__":
-    demo_data_pipeline() 
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Run the data processing pipeline demo.")
+    parser.add_argument("--llm", action="store_true",
+                        help="run the inputs through the LLM agent pipeline instead of locally")
+    parser.add_argument("--batch", action="store_true",
+                        help="with --llm, process all example inputs in a single batched prompt")
+    args = parser.parse_args()
+    
+    asyncio.run(demo_data_pipeline(batch=args.batch, use_llm=args.llm)) 
\ No newline at end of file
@@ -7,17 +7,24 @@ This script demonstrates the data processing pipeline with various input types.
 
 import sys
 import os
+import asyncio
+import argparse
 
 # Add project root to path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from data_processor import create_data_pipeline, demo_data_pipeline
+# data_processor (and the ADK stack behind it) is imported inside the
+# functions below, so exiting at the menu does not pay for loading it
 from utils.session_helpers import ADKSessionManager, validate_config
+from utils.input_helpers import enable_input_history
 from config import print_config_summary
 
-def interactive_pipeline():
+def interactive_pipeline(pipeline=None):
     """
     Run the data pipeline in interactive mode.
+    
+    Args:
+        pipeline: Optional existing pipeline to reuse (one is created if not provided)
     """
     print("\n🔄 Interactive Data Pipeline")
     print("=" * 40)
@@ -26,9 +33,12 @@ def interactive_pipeline():
     print("- Type 'quit' or 'exit' to stop")
     print("-" * 40)
     
+    from data_processor import create_data_pipeline
+    
     # Create the pipeline and session
     try:
-        pipeline = create_data_pipeline()
+        if pipeline is None:
+            pipeline = create_data_pipeline()
         session_manager = ADKSessionManager(app_name="interactive_pipeline")
         session_manager.create_runner(pipeline)
     except Exception as e:
@@ -57,26 +67,35 @@ def interactive_pipeline():
         except Exception as e:
             print(f"❌ Error: {e}")
 
-def run_examples():
+def run_examples(pipeline=None, use_llm: bool = False):
     """
     Run predefined examples.
+    
+    Args:
+        pipeline: Optional existing pipeline to reuse (one is created if not provided)
+        use_llm: Route the examples through the LLM agent pipeline instead of
+            running the steps locally
     """
+    from data_processor import demo_data_pipeline
+    
     print("🚀 Running predefined pipeline examples...")
-    demo_data_pipeline()
+    asyncio.run(demo_data_pipeline(pipeline, use_llm=use_llm))
 
 def main():
     """
     Main function to run the sequential workflow example.
     """
+    parser = argparse.ArgumentParser(description="Run the sequential workflow example.")
+    parser.add_argument("--llm", action="store_true",
+                        help="run the predefined examples through the LLM agent pipeline")
+    args = parser.parse_args()
+    
+    # Line editing and history for the prompts below
+    enable_input_history(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".hist"))
+    
     print("🔄 Sequential Workflow - Data Processing Pipeline")
     print("=" * 60)
     
-    # Check configuration
-    if not validate_config():
-        print("❌ Configuration error. Please check your setup.")
-        print("Make sure you have set GOOGLE_API_KEY in your environment or .env file.")
-        return
-    
     # Print configuration summary
     print_config_summary()
     
@@ -89,16 +108,28 @@ def main():
     try:
         choice = input("\nEnter your choice (1-3): ").strip()
         
+        # Build the pipeline once and share it between the demos; the local
+        # examples run without it, so only they skip the API key check
+        pipeline = None
+        if args.llm or choice in ("2", "3"):
+            if not validate_config():
+                print("❌ Configuration error. Please check your setup.")
+                print("Make sure you have set GOOGLE_API_KEY in your environment or .env file.")
+                return
+            
+            from data_processor import create_data_pipeline
+            pipeline = create_data_pipeline()
+        
         if choice == "1":
-            run_examples()
+            run_examples(pipeline, args.llm)
         elif choice == "2":
-            interactive_pipeline()
+            interactive_pipeline(pipeline)
         elif choice == "3":
-            run_examples()
-            interactive_pipeline()
+            run_examples(pipeline, args.llm)
+            interactive_pipeline(pipeline)
         else:
             print("Invalid choice. Running examples by default.")
-            run_examples()
+            run_examples(pipeline, args.llm)
             
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")
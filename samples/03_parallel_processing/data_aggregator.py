@@ -12,30 +12,32 @@ All agents run in parallel to maximize performance and efficiency.
 
 import sys
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 import time
 import random
-from datetime import datetime
+import asyncio
 
 # Add project root to path for imports
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from config import GOOGLE_API_KEY, DEFAULT_MODEL, validate_required_config
+from config import DEFAULT_MODEL, MAX_CONCURRENT_QUERIES, validate_required_config
 from utils.session_helpers import validate_config
 
-import google.generativeai as genai
-from google.adk.agents import LlmAgent, ParallelAgent
+if TYPE_CHECKING:
+    from google.adk.agents import ParallelAgent
 
-# Configure Google AI
-if GOOGLE_API_KEY:
-    genai.configure(api_key=GOOGLE_API_KEY)
+# Mock data choices, built once at import time
+_WEATHER_CONDITIONS = ("Sunny", "Cloudy", "Rainy", "Partly Cloudy", "Snowy", "Foggy")
+_NEWS_SENTIMENTS = ("positive", "neutral", "mixed")
 
-def fetch_weather_data(city: str) -> Dict[str, Any]:
+async def fetch_weather_data(city: str) -> Dict[str, Any]:
     """
     Fetches weather data for a specified city.
     
     This simulates an API call with realistic delays and data.
-    In production, you would integrate with a real weather API.
+    In production, you would integrate with a real weather API using an
+    async HTTP client (e.g. aiohttp.ClientSession) so the call does not
+    block the event loop.
     
     Args:
         city: The city to get weather data for
@@ -43,15 +45,18 @@ def fetch_weather_data(city: str) -> Dict[str, Any]:
     Returns:
         Dictionary with weather information and metadata
     """
-    # Simulate API call delay (realistic network latency)
-    delay = random.uniform(0.8, 2.0)
-    time.sleep(delay)
+    # Bind the RNG methods to locals to skip repeated attribute lookups
+    uniform, randint, choice = random.uniform, random.randint, random.choice
+    
+    # Simulate API call delay (realistic network latency) without blocking
+    # the event loop, so the parallel agents' tool calls can overlap
+    delay = uniform(0.8, 2.0)
+    await asyncio.sleep(delay)
     
     # Mock weather data
-    conditions = ["Sunny", "Cloudy", "Rainy", "Partly Cloudy", "Snowy", "Foggy"]
-    temperature = random.randint(-5, 35)
-    humidity = random.randint(30, 90)
-    wind_speed = random.randint(0, 25)
+    temperature = randint(-5, 35)
+    humidity = randint(30, 90)
+    wind_speed = randint(0, 25)
     
     return {
         "status": "success",
@@ -59,24 +64,25 @@ def fetch_weather_data(city: str) -> Dict[str, Any]:
         "city": city,
         "data": {
             "temperature": f"{temperature}°C",
-            "condition": random.choice(conditions),
+            "condition": choice(_WEATHER_CONDITIONS),
             "humidity": f"{humidity}%",
             "wind_speed": f"{wind_speed} km/h",
-            "visibility": f"{random.randint(5, 20)} km"
+            "visibility": f"{randint(5, 20)} km"
         },
         "metadata": {
-            "fetch_time": datetime.now().isoformat(),
+            "fetch_time": time.time(),  # seconds since the epoch
             "api_delay": f"{delay:.2f}s",
             "data_freshness": "real-time"
         }
     }
 
-def fetch_news_data(topic: str) -> Dict[str, Any]:
+async def fetch_news_data(topic: str) -> Dict[str, Any]:
     """
     Fetches news data for a specified topic.
     
     This simulates a news API call with realistic content.
-    In production, you would integrate with a real news API.
+    In production, you would integrate with a real news API using an
+    async HTTP client (e.g. aiohttp.ClientSession).
     
     Args:
         topic: The topic to get news for
@@ -84,9 +90,12 @@ def fetch_news_data(topic: str) -> Dict[str, Any]:
     Returns:
         Dictionary with news information and metadata
     """
+    # Bind the RNG methods to locals to skip repeated attribute lookups
+    uniform, randint, choice = random.uniform, random.randint, random.choice
+    
     # Simulate API call delay
-    delay = random.uniform(1.0, 2.5)
-    time.sleep(delay)
+    delay = uniform(1.0, 2.5)
+    await asyncio.sleep(delay)
     
     # Mock news data
     headlines = [
@@ -98,7 +107,7 @@ def fetch_news_data(topic: str) -> Dict[str, Any]:
     ]
     
     selected_headlines = random.sample(headlines, 3)
-    article_count = random.randint(50, 500)
+    article_count = randint(50, 500)
     
     return {
         "status": "success",
@@ -107,22 +116,23 @@ def fetch_news_data(topic: str) -> Dict[str, Any]:
         "data": {
             "headlines": selected_headlines,
             "total_articles": article_count,
-            "trending_score": random.randint(60, 100),
-            "sentiment": random.choice(["positive", "neutral", "mixed"])
+            "trending_score": randint(60, 100),
+            "sentiment": choice(_NEWS_SENTIMENTS)
         },
         "metadata": {
-            "fetch_time": datetime.now().isoformat(),
+            "fetch_time": time.time(),  # seconds since the epoch
             "api_delay": f"{delay:.2f}s",
-            "sources_count": random.randint(10, 50)
+            "sources_count": randint(10, 50)
         }
     }
 
-def fetch_stock_data(symbol: str) -> Dict[str, Any]:
+async def fetch_stock_data(symbol: str) -> Dict[str, Any]:
     """
     Fetches stock market data for a specified symbol.
     
     This simulates a financial API call with realistic market data.
-    In production, you would integrate with a real financial API.
+    In production, you would integrate with a real financial API using an
+    async HTTP client (e.g. aiohttp.ClientSession).
     
     Args:
         symbol: The stock symbol to get data for
@@ -130,15 +140,18 @@ def fetch_stock_data(symbol: str) -> Dict[str, Any]:
     Returns:
         Dictionary with stock information and metadata
     """
+    # Bind the RNG methods to locals to skip repeated attribute lookups
+    uniform, randint, rand = random.uniform, random.randint, random.random
+    
     # Simulate API call delay
-    delay = random.uniform(0.5, 1.8)
-    time.sleep(delay)
+    delay = uniform(0.5, 1.8)
+    await asyncio.sleep(delay)
     
     # Mock stock data
-    base_price = random.uniform(50, 500)
-    change = random.uniform(-20, 20)
+    base_price = uniform(50, 500)
+    change = uniform(-20, 20)
     change_percent = (change / base_price) * 100
-    volume = random.randint(100000, 10000000)
+    volume = randint(100000, 10000000)
     
     return {
         "status": "success",
@@ -149,17 +162,17 @@ def fetch_stock_data(symbol: str) -> Dict[str, Any]:
             "change": f"{change:+.2f}",
             "change_percent": f"{change_percent:+.2f}%",
             "volume": f"{volume:,}",
-            "market_cap": f"${random.randint(1, 100)}B",
-            "pe_ratio": f"{random.uniform(10, 30):.1f}"
+            "market_cap": f"${randint(1, 100)}B",
+            "pe_ratio": f"{uniform(10, 30):.1f}"
         },
         "metadata": {
-            "fetch_time": datetime.now().isoformat(),
+            "fetch_time": time.time(),  # seconds since the epoch
             "api_delay": f"{delay:.2f}s",
-            "market_status": "open" if random.choice([True, False]) else "closed"
+            "market_status": "open" if rand() < 0.5 else "closed"
         }
     }
 
-def create_data_aggregator() -> ParallelAgent:
+def create_data_aggregator() -> "ParallelAgent":
     """
     Creates and configures the parallel data aggregation system.
     
@@ -170,6 +183,9 @@ def create_data_aggregator() -> ParallelAgent:
     if not validate_config():
         raise ValueError("Invalid configuration. Please check your API key.")
     
+    # Import the ADK stack only when an aggregator is actually built
+    from google.adk.agents import LlmAgent, ParallelAgent
+    
     # Create individual agents for each data source
     weather_agent = LlmAgent(
         name="weather_agent",
@@ -213,9 +229,18 @@ def create_data_aggregator() -> ParallelAgent:
     
     return aggregator
 
-def demo_parallel_processing():
+async def demo_parallel_processing(max_concurrency: Optional[int] = None):
     """
     Demonstrates the parallel data aggregation with performance timing.
+    
+    Besides the ParallelAgent fan-out inside each query, the example queries
+    themselves run concurrently, each in its own session, and results are
+    printed as soon as each query finishes.
+    
+    Args:
+        max_concurrency: Optional limit on queries in flight at once
+            (defaults to MAX_CONCURRENT_QUERIES), to stay within provider
+            rate limits
     """
     from utils.session_helpers import ADKSessionManager, print_session_info
     
@@ -249,23 +274,20 @@ def demo_parallel_processing():
     print("-" * 50)
     
     total_start_time = time.time()
-    
-    for i, query in enumerate(example_queries, 1):
-        print(f"\n{i}. Query: {query}")
-        
-        # Time individual query
-        start_time = time.time()
+    execution_times = []
+    
+    # Print each result as soon as it lands instead of waiting for the slowest
+    async for index, response, execution_time in session_manager.iter_queries_as_completed(
+        example_queries, max_concurrency=max_concurrency or MAX_CONCURRENT_QUERIES
+    ):
+        execution_times.append(execution_time)
+        print(f"\n{index + 1}. Query: {example_queries[index]}")
         
-        try:
-            response = session_manager.run_query(query)
-            end_time = time.time()
-            execution_time = end_time - start_time
-            
+        if isinstance(response, Exception):
+            print(f"   ❌ Error: {response}")
+        else:
             print(f"   ⏱️  Execution time: {execution_time:.2f} seconds")
             print(f"   📊 Response preview: {response[:150]}...")
-            
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
     
     total_end_time = time.time()
     total_time = total_end_time - total_start_time
@@ -273,10 +295,12 @@ def demo_parallel_processing():
     print(f"\n" + "=" * 50)
     print(f"🏁 Demo completed!")
     print(f"📈 Total execution time: {total_time:.2f} seconds")
-    print(f"⚡ Average per query: {total_time/len(example_queries):.2f} seconds")
+    if execution_times:
+        print(f"⚡ Average per query: {sum(execution_times) / len(execution_times):.2f} seconds")
     print("\n💡 Performance Note:")
     print("   - Each query runs 3 agents in parallel")
-    print("   - Sequential execution would take ~3x longer")
+    print("   - The queries themselves also run concurrently")
+    print("   - Sequential execution would take ~3x longer per query")
     print("   - Parallel processing provides significant speedup!")
 
 def benchmark_parallel_vs_sequential():
@@ -308,5 +332,5 @@ def benchmark_parallel_vs_sequential():
     print("   ✅ Scalable architecture")
 
 if __name__ == "__main__":
-    demo_parallel_processing()
+    asyncio.run(demo_parallel_processing())
     benchmark_parallel_vs_sequential() 
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Shared fixtures for the tests: a fake ADK runner that answers without any
+network access.
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from utils.session_helpers import ADKSessionManager
+
+
+class FakeEvent:
+    """A final-response event from one agent."""
+    
+    def __init__(self, author, text):
+        self.author = author
+        self.content = SimpleNamespace(parts=[SimpleNamespace(text=text)])
+    
+    def is_final_response(self):
+        return True
+
+
+class FakeRunner:
+    """
+    Stands in for google.adk.runners.Runner.
+    
+    Each call yields one final response per entry in `authors`, like a
+    SequentialAgent does for its sub-agents. The last agent's text comes from
+    `reply(prompt)`; earlier agents answer with a fixed message.
+    """
+    
+    def __init__(self, reply=None, authors=("agent",), delay=0.0, instruction="Be helpful."):
+        self.agent = SimpleNamespace(name="fake_agent", instruction=instruction)
+        self.reply = reply or (lambda prompt: f"echo: {prompt}")
+        self.authors = authors
+        self.delay = delay
+        self.calls = []  # (session_id, prompt) per call
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    def _events(self, prompt):
+        *intermediate, last = self.authors
+        events = [FakeEvent(author, f"{author} output") for author in intermediate]
+        events.append(FakeEvent(last, self.reply(prompt)))
+        return events
+    
+    def run(self, user_id, session_id, new_message):
+        prompt = new_message.parts[0].text
+        self.calls.append((session_id, prompt))
+        yield from self._events(prompt)
+    
+    async def run_async(self, user_id, session_id, new_message):
+        prompt = new_message.parts[0].text
+        self.calls.append((session_id, prompt))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            for event in self._events(prompt):
+                yield event
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def make_manager():
+    """Build an ADKSessionManager whose runner is a FakeRunner."""
+    def factory(runner=None, **kwargs):
+        manager = ADKSessionManager(app_name="test_app", **kwargs)
+        manager.runner = runner or FakeRunner()
+        return manager
+    return factory
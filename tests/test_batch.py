@@ -0,0 +1,59 @@
+"""
+Tests for batched queries in utils.session_helpers.
+"""
+
+import asyncio
+import json
+
+from conftest import FakeRunner
+from utils.session_helpers import ADKSessionManager
+
+
+def test_parse_batch_response():
+    assert ADKSessionManager._parse_batch_response('["a", "b"]', 2) == ["a", "b"]
+
+
+def test_parse_batch_response_strips_code_fence():
+    response = '```json\n["a", {"b": 1}]\n```'
+    assert ADKSessionManager._parse_batch_response(response, 2) == ["a", '{"b": 1}']
+
+
+def test_parse_batch_response_rejects_invalid():
+    assert ADKSessionManager._parse_batch_response("not json", 1) is None
+    assert ADKSessionManager._parse_batch_response('{"a": 1}', 1) is None
+
+
+def test_parse_batch_response_rejects_wrong_length():
+    assert ADKSessionManager._parse_batch_response('["a"]', 2) is None
+
+
+def _batch_reply(prompt):
+    # The formatter answers a batch prompt with one object per item
+    if prompt.startswith("Process each of the following"):
+        count = prompt.count("\nItem ")
+        return json.dumps([{"item": i} for i in range(1, count + 1)])
+    return f"single: {prompt}"
+
+
+def test_run_batch_async_is_one_call_through_a_pipeline(make_manager):
+    runner = FakeRunner(reply=_batch_reply, authors=("data_extractor", "data_validator", "data_formatter"))
+    manager = make_manager(runner)
+    
+    results = asyncio.run(manager.run_batch_async(["first", "second"]))
+    
+    assert results == ['{"item": 1}', '{"item": 2}']
+    assert len(runner.calls) == 1
+
+
+def test_run_batch_async_falls_back_to_one_session_per_item(make_manager):
+    runner = FakeRunner(reply=lambda prompt: "not a json array")
+    manager = make_manager(runner)
+    
+    results = asyncio.run(manager.run_batch_async(["first", "second"]))
+    
+    assert results == ["not a json array"] * 2
+    batch_call, *item_calls = runner.calls
+    assert batch_call[0] == manager.session_id
+    assert sorted(prompt for _, prompt in item_calls) == ["first", "second"]
+    assert len({session_id for session_id, _ in item_calls}) == 2
+    assert manager.session_id not in {session_id for session_id, _ in item_calls}
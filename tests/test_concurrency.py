@@ -0,0 +1,85 @@
+"""
+Tests for concurrent queries in utils.session_helpers.
+"""
+
+import asyncio
+
+from conftest import FakeRunner
+from utils.session_helpers import ADKSessionManager
+
+
+async def _collect(manager, queries, **kwargs):
+    return [result async for result in manager.iter_queries_as_completed(queries, **kwargs)]
+
+
+def test_create_query_sessions_are_unique_and_registered(make_manager):
+    manager = make_manager()
+    
+    async def create():
+        first = await manager.create_query_sessions(3)
+        second = await manager.create_query_sessions(3)
+        sessions = [
+            await manager.session_service.get_session(
+                app_name=manager.app_name, user_id=manager.user_id, session_id=session_id
+            )
+            for session_id in first + second
+        ]
+        return first, second, sessions
+    
+    first, second, sessions = asyncio.run(create())
+    
+    assert len(set(first + second)) == 6
+    assert all(session is not None for session in sessions)
+
+
+def test_iter_queries_as_completed_maps_indices_back(make_manager):
+    # Later queries finish first, so completion order differs from input order
+    queries = ["slow", "medium", "fast"]
+    delays = {"slow": 0.03, "medium": 0.02, "fast": 0.0}
+    
+    class StaggeredRunner(FakeRunner):
+        async def run_async(self, user_id, session_id, new_message):
+            await asyncio.sleep(delays[new_message.parts[0].text])
+            async for event in super().run_async(user_id, session_id, new_message):
+                yield event
+    
+    runner = StaggeredRunner()
+    results = asyncio.run(_collect(make_manager(runner), queries))
+    
+    assert [index for index, _, _ in results] == [2, 1, 0]
+    for index, response, elapsed in results:
+        assert response == f"echo: {queries[index]}"
+        assert elapsed >= 0
+
+
+def test_iter_queries_as_completed_uses_one_session_per_query(make_manager):
+    runner = FakeRunner()
+    manager = make_manager(runner)
+    
+    asyncio.run(_collect(manager, ["a", "b", "c"]))
+    
+    session_ids = [session_id for session_id, _ in runner.calls]
+    assert len(set(session_ids)) == 3
+    assert manager.session_id not in session_ids
+
+
+def test_iter_queries_as_completed_respects_max_concurrency(make_manager):
+    runner = FakeRunner(delay=0.01)
+    
+    results = asyncio.run(_collect(make_manager(runner), [str(i) for i in range(6)], max_concurrency=2))
+    
+    assert len(results) == 6
+    assert runner.max_in_flight == 2
+
+
+def test_iter_queries_as_completed_yields_exceptions(make_manager, monkeypatch):
+    async def failing_query(self, query, runner=None, session_id=None):
+        raise RuntimeError(f"failed: {query}")
+    
+    monkeypatch.setattr(ADKSessionManager, "run_query_async", failing_query)
+    
+    [(index, response, _)] = asyncio.run(_collect(make_manager(), ["a"]))
+    
+    assert index == 0
+    assert isinstance(response, RuntimeError)
+    assert str(response) == "failed: a"
@@ -0,0 +1,50 @@
+"""
+Tests for the local tool functions of the sequential workflow sample.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "samples", "02_sequential_workflow"))
+
+import pytest
+
+from data_processor import extract_data
+
+
+@pytest.mark.parametrize("text, content_type", [
+    ("Sales revenue increased by 25% this quarter compared to last year.", "business"),
+    ("Customer feedback indicates high satisfaction with our new product launch.", "customer_feedback"),
+    ("The development team successfully delivered the new feature on schedule.", "product"),
+    ("Our business strategy focuses on customer-centric product development and innovation.", "business"),
+    ("Short text", "general"),
+    ("Our products are great", "product"),
+    ("Review: good", "customer_feedback"),
+    ("Happy customers everywhere", "customer_feedback"),
+    ("(Feature) shipped", "product"),
+    # Keywords are matched as whole words only
+    ("Wholesales up", "general"),
+])
+def test_extract_data_content_type(text, content_type):
+    assert extract_data(text)["content_type"] == content_type
+
+
+def test_extract_data_keywords_and_entities():
+    result = extract_data("Sales revenue increased by 25% this quarter compared to last year.")
+    
+    assert result["word_count"] == 11
+    assert result["numbers"] == ["25"]
+    assert result["entities"] == ["Sales"]
+    # "year." is only 4 characters once its punctuation is removed
+    assert result["keywords"] == ["sales", "revenue", "increased", "quarter", "compared"]
+    assert result["extracted_data"]["key_elements"] == ["Sales", "sales", "revenue", "increased"]
+
+
+def test_extract_data_limits_entities_and_keywords():
+    text = " ".join(f"Word{i}." for i in range(20))
+    result = extract_data(text)
+    
+    assert result["word_count"] == 20
+    assert result["entities"] == [f"Word{i}" for i in range(5)]
+    assert result["keywords"] == [f"word{i}" for i in range(10)]
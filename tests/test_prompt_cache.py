@@ -0,0 +1,74 @@
+"""
+Tests for the exact-match prompt cache in utils.session_helpers.
+"""
+
+import asyncio
+
+from config import PROMPT_CACHE_ENABLED
+from conftest import FakeRunner
+from utils.session_helpers import _normalize_prompt
+
+
+def test_normalize_prompt():
+    assert _normalize_prompt("  hello\r\n  world  \r") == "hello\nworld"
+    assert _normalize_prompt("hello\nworld") == _normalize_prompt("hello  \n\tworld\n")
+
+
+def test_normalize_prompt_keeps_inner_whitespace():
+    assert _normalize_prompt("a  b") != _normalize_prompt("a b")
+
+
+def test_cache_follows_config_by_default(make_manager):
+    assert make_manager().enable_cache is PROMPT_CACHE_ENABLED
+
+
+def test_cache_disabled_always_calls_runner(make_manager):
+    runner = FakeRunner()
+    manager = make_manager(runner, enable_cache=False)
+    
+    assert manager.run_query("hello") == manager.run_query("hello") == "echo: hello"
+    assert len(runner.calls) == 2
+
+
+def test_cache_hit_skips_runner(make_manager):
+    runner = FakeRunner()
+    manager = make_manager(runner, enable_cache=True)
+    
+    first = manager.run_query("hello")
+    # Normalized spellings share an entry, in both the sync and async paths
+    second = asyncio.run(manager.run_query_async("  hello \r\n"))
+    
+    assert first == second == "echo: hello"
+    assert len(runner.calls) == 1
+
+
+def test_cache_miss_for_different_prompt(make_manager):
+    runner = FakeRunner()
+    manager = make_manager(runner, enable_cache=True)
+    
+    manager.run_query("hello")
+    manager.run_query("goodbye")
+    
+    assert len(runner.calls) == 2
+
+
+def test_cache_key_changes_with_agent_instruction(make_manager):
+    runner = FakeRunner()
+    manager = make_manager(runner, enable_cache=True)
+    
+    manager.run_query("hello")
+    runner.agent.instruction = "Be terse."
+    manager.run_query("hello")
+    
+    assert len(runner.calls) == 2
+
+
+def test_clear_cache(make_manager):
+    runner = FakeRunner()
+    manager = make_manager(runner, enable_cache=True)
+    
+    manager.run_query("hello")
+    manager.clear_cache()
+    manager.run_query("hello")
+    
+    assert len(runner.calls) == 2
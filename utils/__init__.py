@@ -10,13 +10,19 @@ from .session_helpers import (
     create_simple_session,
     run_simple_query,
     validate_config,
+    configure_genai,
     print_session_info
 )
+from .semantic_cache import SemanticCache
+from .input_helpers import enable_input_history
 
 __all__ = [
     "ADKSessionManager",
     "create_simple_session", 
     "run_simple_query",
     "validate_config",
-    "print_session_info"
+    "configure_genai",
+    "print_session_info",
+    "SemanticCache",
+    "enable_input_history"
 ] 
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""
+Input helpers for the interactive ADK samples.
+
+This module provides line editing and persistent history for the
+interactive input() loops used by the sample runners.
+"""
+
+import atexit
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _write_history(readline, history_file: str) -> None:
+    """Save the input history, ignoring unwritable locations."""
+    try:
+        readline.write_history_file(history_file)
+    except OSError as e:
+        logger.debug(f"Could not save input history to {history_file}: {e}")
+
+def enable_input_history(history_file: str = ".hist", history_length: int = 1000) -> bool:
+    """
+    Enable line editing and persistent history for input() prompts.
+    
+    Previously entered queries can be recalled with the arrow keys.
+    
+    Args:
+        history_file: Path of the file the history is loaded from and saved to
+        history_length: Maximum number of entries kept in the history file
+    
+    Returns:
+        True if readline is available and history was enabled, False otherwise
+    """
+    try:
+        import readline
+    except ImportError:
+        # readline is not available on every platform (e.g. Windows)
+        logger.debug("readline not available; input history disabled")
+        return False
+    
+    readline.parse_and_bind("tab: complete")
+    readline.set_history_length(history_length)
+    try:
+        readline.read_history_file(history_file)
+    except OSError:
+        pass  # No history yet
+    
+    atexit.register(_write_history, readline, history_file)
+    return True
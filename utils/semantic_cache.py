@@ -0,0 +1,122 @@
+"""
+Semantic prompt cache for ADK samples.
+
+This module provides a cache that matches prompts by meaning rather than by
+exact text, so paraphrases such as "weather in Paris?" and "Paris weather?"
+can reuse a previous response. Prompts are embedded with a
+sentence-transformers model and looked up in a FAISS inner-product index of
+L2-normalized vectors (i.e. cosine similarity).
+
+sentence-transformers and faiss are optional dependencies; they are only
+imported when a SemanticCache is created.
+"""
+
+import sys
+import os
+from typing import Optional, Dict, List, Tuple, Any
+import logging
+
+# Add parent directory to path for config import
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import SEMANTIC_CACHE_MODEL, SEMANTIC_CACHE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+class SemanticCache:
+    """
+    Caches responses keyed by prompt embeddings.
+    
+    Entries are grouped by namespace (e.g. model and agent) so that a response
+    produced by one agent is never returned for another.
+    """
+    
+    def __init__(self, model_name: Optional[str] = None, threshold: Optional[float] = None):
+        """
+        Initialize the semantic cache.
+        
+        Args:
+            model_name: Optional sentence-transformers model name override
+            threshold: Optional cosine similarity threshold override; a lookup
+                is a hit only when the best match scores above it
+        """
+        try:
+            import faiss
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "Semantic caching requires the optional 'sentence-transformers' and "
+                "'faiss-cpu' packages. Install them with: "
+                "pip install sentence-transformers faiss-cpu"
+            ) from e
+        
+        self._faiss = faiss
+        self.model_name = model_name or SEMANTIC_CACHE_MODEL
+        self.threshold = SEMANTIC_CACHE_THRESHOLD if threshold is None else threshold
+        self._model = SentenceTransformer(self.model_name)
+        self._dimension = self._model.get_sentence_embedding_dimension()
+        
+        # namespace -> (index of normalized embeddings, responses by row)
+        self._entries: Dict[str, Tuple[Any, List[str]]] = {}
+        
+        logger.info(f"Initialized semantic cache with model: {self.model_name}")
+    
+    def embed(self, prompt: str):
+        """
+        Embed a prompt as an L2-normalized float32 row vector.
+        
+        Args:
+            prompt: The prompt text
+        
+        Returns:
+            A (1, dimension) numpy array
+        """
+        vector = self._model.encode([prompt], convert_to_numpy=True).astype("float32")
+        self._faiss.normalize_L2(vector)
+        return vector
+    
+    def lookup(self, vector, namespace: str = "") -> Optional[str]:
+        """
+        Find a cached response for a prompt embedding.
+        
+        Args:
+            vector: The prompt embedding returned by embed()
+            namespace: The namespace to search
+        
+        Returns:
+            The cached response, or None if nothing is similar enough
+        """
+        entry = self._entries.get(namespace)
+        if entry is None:
+            return None
+        
+        index, responses = entry
+        if index.ntotal == 0:
+            return None
+        
+        scores, ids = index.search(vector, 1)
+        if scores[0, 0] > self.threshold:
+            logger.debug(f"Semantic cache hit (similarity {scores[0, 0]:.3f})")
+            return responses[ids[0, 0]]
+        
+        return None
+    
+    def add(self, vector, response: str, namespace: str = "") -> None:
+        """
+        Store a response for a prompt embedding.
+        
+        Args:
+            vector: The prompt embedding returned by embed()
+            response: The response to cache
+            namespace: The namespace to store the entry in
+        """
+        if namespace not in self._entries:
+            self._entries[namespace] = (self._faiss.IndexFlatIP(self._dimension), [])
+        
+        index, responses = self._entries[namespace]
+        index.add(vector)
+        responses.append(response)
+    
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
@@ -7,7 +7,14 @@ in a consistent way across all examples.
 
 import sys
 import os
-from typing import Optional, Dict, Any
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+import functools
+import inspect
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, TYPE_CHECKING
 import logging
 
 # Add parent directory to path for config import
@@ -15,37 +22,92 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import (
     GOOGLE_API_KEY, DEFAULT_MODEL, DEFAULT_APP_NAME, 
-    DEFAULT_USER_ID, DEFAULT_SESSION_ID, get_session_config, get_model_config
+    DEFAULT_USER_ID, DEFAULT_SESSION_ID, PROMPT_CACHE_ENABLED,
+    SEMANTIC_CACHE_ENABLED, MAX_CONCURRENT_QUERIES, get_session_config,
+    get_model_config
 )
 
-import google.generativeai as genai
-from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
-from google.genai import types
+from .semantic_cache import SemanticCache
+
+# The ADK/genai stack is imported lazily where it is used, so importing this
+# module (e.g. for validate_config) stays cheap
+if TYPE_CHECKING:
+    from google.adk.runners import Runner
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def configure_genai() -> bool:
+    """
+    Configure the Google AI client with GOOGLE_API_KEY, once per process.
+    
+    ADKSessionManager calls this before any query runs, so creating several
+    managers (e.g. in a notebook) only configures the client the first time. Call configure_genai.cache_clear() to force
+    reconfiguration.
+    
+    Returns:
+        True if the client was configured, False if GOOGLE_API_KEY is not set
+    """
+    if not GOOGLE_API_KEY:
+        return False
+    
+    import google.generativeai as genai
+    
+    genai.configure(api_key=GOOGLE_API_KEY)
+    return True
+
+def _normalize_prompt(prompt: str) -> str:
+    """
+    Normalize a prompt for cache lookups.
+    
+    Canonicalizes newlines and strips surrounding whitespace from the prompt
+    and from each of its lines, so trivially different spellings of the same
+    prompt share a cache entry.
+    
+    Args:
+        prompt: The raw prompt text
+        
+    Returns:
+        The normalized prompt text
+    """
+    lines = prompt.replace("\r\n", "\n").replace("\r", "\n").strip().split("\n")
+    return "\n".join(line.strip() for line in lines)
+
 class ADKSessionManager:
     """
     Manages ADK sessions and provides convenient methods for agent execution.
     """
     
-    def __init__(self, app_name: Optional[str] = None, user_id: Optional[str] = None):
+    __slots__ = (
+        "app_name", "user_id", "session_id", "session_service", "session",
+        "runner", "enable_cache", "_cache", "semantic_cache"
+    )
+    
+    def __init__(self, app_name: Optional[str] = None, user_id: Optional[str] = None,
+                 enable_cache: Optional[bool] = None,
+                 semantic_cache: Optional[SemanticCache] = None):
         """
         Initialize the session manager.
         
         Args:
             app_name: Optional app name override
             user_id: Optional user ID override
+            enable_cache: Optional override for the exact-match prompt cache
+                (defaults to PROMPT_CACHE_ENABLED, which is off). Cached
+                responses are shared across sessions and ignore conversation
+                history, so only enable it for stateless, repeatable queries
+            semantic_cache: Optional semantic cache to consult after the
+                exact-match cache (one is created automatically when
+                SEMANTIC_CACHE_ENABLED is set)
         """
         self.app_name = app_name or DEFAULT_APP_NAME
         self.user_id = user_id or DEFAULT_USER_ID
         self.session_id = DEFAULT_SESSION_ID
         
+        from google.adk.sessions import InMemorySessionService
+        
         # Configure Google AI
-        if GOOGLE_API_KEY:
-            genai.configure(api_key=GOOGLE_API_KEY)
-        else:
+        if not configure_genai():
             logger.warning("GOOGLE_API_KEY not set. Some functionality may not work.")
         
         # Initialize session service
@@ -53,12 +115,31 @@ class ADKSessionManager:
         self.session = None
         self.runner = None
         
+        # Exact-match prompt cache: cache key -> final response
+        self.enable_cache = PROMPT_CACHE_ENABLED if enable_cache is None else enable_cache
+        self._cache: Dict[str, str] = {}
+        
+        # Semantic cache for paraphrased prompts (optional dependencies)
+        if semantic_cache is None and SEMANTIC_CACHE_ENABLED:
+            semantic_cache = SemanticCache()
+        self.semantic_cache = semantic_cache
+        
         self._create_session()
     
     def _create_session(self) -> None:
-        """Create a new session."""
+        """
+        Create the manager's default session.
+        
+        Newer ADK releases make ``create_session`` a coroutine; from
+        synchronous code the service's ``create_session_sync`` is used instead.
+        Additional sessions are created with create_session_async.
+        """
+        create = self.session_service.create_session
+        if inspect.iscoroutinefunction(create):
+            create = self.session_service.create_session_sync
+        
         try:
-            self.session = self.session_service.create_session(
+            self.session = create(
                 app_name=self.app_name,
                 user_id=self.user_id,
                 session_id=self.session_id
@@ -68,7 +149,35 @@ class ADKSessionManager:
             logger.error(f"Failed to create session: {e}")
             raise
     
-    def create_runner(self, agent) -> Runner:
+    async def create_session_async(self, session_id: str):
+        """
+        Create an additional session for this manager's app and user asynchronously.
+        
+        Concurrent queries should each run in their own session so that
+        their conversation history and state do not interleave.
+        
+        Args:
+            session_id: The ID for the new session
+            
+        Returns:
+            The created session
+        """
+        try:
+            session = self.session_service.create_session(
+                app_name=self.app_name,
+                user_id=self.user_id,
+                session_id=session_id
+            )
+            # Older ADK releases create sessions synchronously
+            if inspect.isawaitable(session):
+                session = await session
+            logger.info(f"Created session: {session_id}")
+            return session
+        except Exception as e:
+            logger.error(f"Failed to create session: {e}")
+            raise
+    
+    def create_runner(self, agent) -> "Runner":
         """
         Create a runner for the given agent.
         
@@ -78,6 +187,8 @@ class ADKSessionManager:
         Returns:
             Runner instance
         """
+        from google.adk.runners import Runner
+        
         try:
             self.runner = Runner(
                 agent=agent,
@@ -90,7 +201,87 @@ class ADKSessionManager:
             logger.error(f"Failed to create runner: {e}")
             raise
     
-    def run_query(self, query: str, runner: Optional[Runner] = None) -> str:
+    def _cache_namespace(self, runner: "Runner") -> str:
+        """
+        Identify the model and agent a cached response belongs to.
+        
+        Args:
+            runner: The runner the query is sent to
+            
+        Returns:
+            Hex SHA-256 digest of the model and the agent's name and instruction
+        """
+        agent = runner.agent
+        agent_id = f"{DEFAULT_MODEL}\n{agent.name}\n{getattr(agent, 'instruction', '') or ''}"
+        return hashlib.sha256(agent_id.encode("utf-8")).hexdigest()
+    
+    def _cache_key(self, query: str, runner: "Runner") -> str:
+        """
+        Build the prompt cache key for a query.
+        
+        The key covers the model and the agent's name and instruction, so
+        switching either invalidates previously cached responses. It does not
+        cover the session or its history, and responses that depend on tool
+        output (weather, prices, ...) are returned as they were first seen.
+        
+        Args:
+            query: The query string
+            runner: The runner the query is sent to
+            
+        Returns:
+            Hex SHA-256 digest identifying the query
+        """
+        key_source = f"{self._cache_namespace(runner)}\n{_normalize_prompt(query)}"
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+    
+    def _lookup_cache(self, query: str, runner: "Runner") -> Tuple[Optional[str], Any]:
+        """
+        Look up a cached response, trying the exact-match cache first.
+        
+        Args:
+            query: The query string
+            runner: The runner the query is sent to
+            
+        Returns:
+            Tuple of the cached response (or None on a miss) and the query
+            embedding (or None if the semantic cache is disabled), which
+            _store_cache reuses so the query is only embedded once
+        """
+        if self.enable_cache:
+            cached = self._cache.get(self._cache_key(query, runner))
+            if cached is not None:
+                logger.debug("Prompt cache hit")
+                return cached, None
+        
+        if self.semantic_cache is None:
+            return None, None
+        
+        vector = self.semantic_cache.embed(query)
+        return self.semantic_cache.lookup(vector, self._cache_namespace(runner)), vector
+    
+    def _store_cache(self, query: str, runner: "Runner", response: str, vector: Any = None) -> None:
+        """
+        Store a response in the enabled caches.
+        
+        Args:
+            query: The query string
+            runner: The runner the query was sent to
+            response: The agent's final response
+            vector: The query embedding returned by _lookup_cache
+        """
+        if self.enable_cache:
+            self._cache[self._cache_key(query, runner)] = response
+        
+        if self.semantic_cache is not None and vector is not None:
+            self.semantic_cache.add(vector, response, self._cache_namespace(runner))
+    
+    def clear_cache(self) -> None:
+        """Remove all entries from the prompt caches."""
+        self._cache.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
+    
+    def run_query(self, query: str, runner: Optional["Runner"] = None) -> str:
         """
         Run a query using the specified runner.
         
@@ -107,6 +298,12 @@ class ADKSessionManager:
         if runner is None:
             raise ValueError("No runner available. Call create_runner() first.")
         
+        cached, vector = self._lookup_cache(query, runner)
+        if cached is not None:
+            return cached
+        
+        from google.genai import types
+        
         try:
             # Create content from user query
             content = types.Content(
@@ -121,16 +318,218 @@ class ADKSessionManager:
                 new_message=content
             )
             
-            # Process events to get the final response
+            # A multi-agent pipeline emits one final response per sub-agent;
+            # the last one is the pipeline's output
+            response = None
             for event in events:
                 if event.is_final_response():
-                    return event.content.parts[0].text
+                    response = event.content.parts[0].text
+            
+            if response is None:
+                return "No response received."
+            
+            self._store_cache(query, runner, response, vector)
+            return response
+            
+        except Exception as e:
+            logger.error(f"Error running query: {e}")
+            return f"Error: {str(e)}"
+    
+    async def run_query_async(self, query: str, runner: Optional["Runner"] = None,
+                              session_id: Optional[str] = None) -> str:
+        """
+        Run a query asynchronously using the specified runner.
+        
+        Awaits the runner's async event stream directly, so several queries
+        can be in flight at once (e.g. with ``asyncio.gather``).
+        
+        Args:
+            query: The query string to process
+            runner: Optional runner instance (uses self.runner if not provided)
+            session_id: Optional session ID (uses the default session if not provided)
+            
+        Returns:
+            The final response from the agent
+        """
+        if runner is None:
+            runner = self.runner
+        
+        if runner is None:
+            raise ValueError("No runner available. Call create_runner() first.")
+        
+        cached, vector = self._lookup_cache(query, runner)
+        if cached is not None:
+            return cached
+        
+        from google.genai import types
+        
+        try:
+            # Create content from user query
+            content = types.Content(
+                role="user",
+                parts=[types.Part(text=query)]
+            )
+            
+            # Run the agent and consume events as they arrive. A multi-agent
+            # pipeline emits one final response per sub-agent; the last one
+            # is the pipeline's output
+            response = None
+            async for event in runner.run_async(
+                user_id=self.user_id,
+                session_id=session_id or self.session_id,
+                new_message=content
+            ):
+                if event.is_final_response():
+                    response = event.content.parts[0].text
             
-            return "No response received."
+            if response is None:
+                return "No response received."
+            
+            self._store_cache(query, runner, response, vector)
+            return response
             
         except Exception as e:
             logger.error(f"Error running query: {e}")
             return f"Error: {str(e)}"
+    
+    async def create_query_sessions(self, count: int) -> List[str]:
+        """
+        Create one fresh session per concurrent query.
+        
+        Args:
+            count: The number of sessions to create
+            
+        Returns:
+            The IDs of the created sessions
+        """
+        prefix = f"{self.session_id}_{uuid.uuid4().hex[:8]}"
+        session_ids = [f"{prefix}_{i}" for i in range(1, count + 1)]
+        await asyncio.gather(*(self.create_session_async(session_id) for session_id in session_ids))
+        return session_ids
+    
+    async def iter_queries_as_completed(self, queries: List[str], runner: Optional["Runner"] = None,
+                                        max_concurrency: Optional[int] = None
+                                        ) -> AsyncIterator[Tuple[int, Any, float]]:
+        """
+        Run several queries concurrently and yield results as they finish.
+        
+        Each query runs in its own session so their history and state do not
+        interleave.
+        
+        Args:
+            queries: The queries to run
+            runner: Optional runner instance (uses self.runner if not provided)
+            max_concurrency: Optional limit on queries in flight at once
+            
+        Yields:
+            Tuples of (index into queries, response or raised exception,
+            execution time in seconds), in completion order
+        """
+        if not queries:
+            return
+        
+        session_ids = await self.create_query_sessions(len(queries))
+        semaphore = asyncio.Semaphore(max_concurrency or len(queries))
+        
+        async def timed_query(index: int, query: str, session_id: str):
+            async with semaphore:
+                start_time = time.time()
+                try:
+                    response = await self.run_query_async(query, runner, session_id)
+                except Exception as e:
+                    response = e
+                return index, response, time.time() - start_time
+        
+        tasks = [
+            timed_query(index, query, session_id)
+            for index, (query, session_id) in enumerate(zip(queries, session_ids))
+        ]
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    
+    @staticmethod
+    def _build_batch_prompt(prompts: List[str]) -> str:
+        """
+        Combine several prompts into a single numbered batch prompt.
+        
+        Args:
+            prompts: The individual prompts
+            
+        Returns:
+            A prompt asking for one JSON result per item, in order
+        """
+        items = "\n".join(f"Item {i}: {prompt}" for i, prompt in enumerate(prompts, 1))
+        return (
+            f"Process each of the following {len(prompts)} items independently.\n"
+            f"{items}\n"
+            f"Respond with only a JSON array containing exactly {len(prompts)} objects, "
+            f"one result per item, in the same order as the items: [{{...}}, {{...}}]"
+        )
+    
+    @staticmethod
+    def _parse_batch_response(response: str, count: int) -> Optional[List[str]]:
+        """
+        Split a batch response into per-item results.
+        
+        Args:
+            response: The raw response to a batch prompt
+            count: The number of items in the batch
+            
+        Returns:
+            One result string per item, or None if the response is not a JSON
+            array of the expected length
+        """
+        text = response.strip()
+        
+        # Models often wrap JSON in a markdown code fence
+        if text.startswith("```"):
+            text = text.split("\n", 1)[1] if "\n" in text else ""
+            text = text.rsplit("```", 1)[0]
+        
+        try:
+            results = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        
+        if not isinstance(results, list) or len(results) != count:
+            return None
+        
+        return [item if isinstance(item, str) else json.dumps(item) for item in results]
+    
+    async def run_batch_async(self, prompts: List[str], runner: Optional["Runner"] = None,
+                              session_id: Optional[str] = None) -> List[str]:
+        """
+        Run several prompts as a single batched query asynchronously.
+        
+        Sending the items together pays the instruction, tool and network
+        overhead once instead of once per item. If the response cannot be split into one result per item, the
+        prompts are run concurrently, each in its own session.
+        
+        Args:
+            prompts: The prompts to process
+            runner: Optional runner instance (uses self.runner if not provided)
+            session_id: Optional session ID (uses the default session if not provided)
+            
+        Returns:
+            One response per prompt, in order
+        """
+        if not prompts:
+            return []
+        
+        response = await self.run_query_async(self._build_batch_prompt(prompts), runner, session_id)
+        results = self._parse_batch_response(response, len(prompts))
+        if results is not None:
+            return results
+        
+        logger.warning("Could not parse batch response; running prompts individually")
+        results = [None] * len(prompts)
+        async for index, result, _ in self.iter_queries_as_completed(
+            prompts, runner, max_concurrency=MAX_CONCURRENT_QUERIES
+        ):
+            if isinstance(result, Exception):
+                raise result
+            results[index] = result
+        return results
 
 def create_simple_session(agent, app_name: Optional[str] = None) -> ADKSessionManager:
     """
@@ -162,10 +561,15 @@ def run_simple_query(agent, query: str, app_name: Optional[str] = None) -> str:
     session_manager = create_simple_session(agent, app_name)
     return session_manager.run_query(query)
 
+@functools.lru_cache(maxsize=1)
 def validate_config() -> bool:
     """
     Validate that the required configuration is available.
     
+    The result is cached, since the launchers and every create_* factory
+    call this. GOOGLE_API_KEY is read once when config is imported, so the
+    result is fixed for the lifetime of the process.
+    
     Returns:
         True if configuration is valid, False otherwise
     """